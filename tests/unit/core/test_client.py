@@ -0,0 +1,83 @@
+"""
+Tests for the central request client.
+
+Tests cover:
+- Reusing a caller-provided requests.Session
+- Decoding response bodies with a custom JSON loader
+"""
+
+import json
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from vnstock.core.utils.client import send_request, send_request_direct
+
+
+def _mock_session(content=b'{"data": [1, 2]}', status_code=200):
+    """Build a Session mock whose POST returns the given body."""
+    response = Mock(status_code=status_code, content=content, reason='OK')
+    session = Mock(spec=requests.Session)
+    session.post.return_value = response
+    return session
+
+
+@pytest.mark.unit
+class TestSendRequestDirect:
+    """Test send_request_direct session and json_loader support."""
+
+    @patch('vnstock.core.utils.client.requests.post')
+    def test_uses_passed_session(self, mock_post):
+        """Test the request goes through the given session."""
+        session = _mock_session()
+
+        send_request_direct(
+            'https://example.com', headers={}, method='POST',
+            payload={'a': 1}, session=session
+        )
+
+        session.post.assert_called_once()
+        assert session.post.call_args.kwargs['data'] == '{"a": 1}'
+        mock_post.assert_not_called()
+
+    def test_uses_passed_json_loader(self):
+        """Test the raw body is decoded by the given loader."""
+        session = _mock_session()
+        bodies = []
+
+        def loader(body):
+            bodies.append(body)
+            return json.loads(body)
+
+        data = send_request_direct(
+            'https://example.com', headers={}, method='POST',
+            payload={'a': 1}, session=session, json_loader=loader
+        )
+
+        assert data == {'data': [1, 2]}
+        assert bodies == [b'{"data": [1, 2]}']
+        session.post.return_value.json.assert_not_called()
+
+    def test_json_loader_error_raises_connection_error(self):
+        """Test an undecodable body is reported as ConnectionError."""
+        session = _mock_session(content=b'not json')
+
+        with pytest.raises(ConnectionError):
+            send_request_direct(
+                'https://example.com', headers={}, method='POST',
+                payload={'a': 1}, session=session, json_loader=json.loads
+            )
+
+    def test_send_request_forwards_session_and_loader(self):
+        """Test send_request passes session and json_loader through."""
+        session = _mock_session()
+        loader = Mock(return_value={'ok': True})
+
+        data = send_request(
+            'https://example.com', headers={}, method='POST',
+            payload={'a': 1}, session=session, json_loader=loader
+        )
+
+        assert data == {'ok': True}
+        session.post.assert_called_once()
+        loader.assert_called_once_with(b'{"data": [1, 2]}')
@@ -4,11 +4,50 @@ Unit tests for VCI Quote explorer.
 Tests VCI-specific quote data fetching, parsing, and transformations.
 """
 
+import asyncio
+import json
+
 import pytest
 import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from vnstock.core.settings import CacheConfig, VnstockConfig, set_config
+from vnstock.core.utils.transform import intraday_to_df
+from vnstock.explorer.vci import quote as vci_quote
+from vnstock.explorer.vci.const import _INTRADAY_DTYPE, _INTRADAY_MAP
 from vnstock.explorer.vci.quote import Quote
 
 
+_OHLC_RESPONSE = [{
+    "symbol": "ACB",
+    "t": [1704153600, 1704240000],
+    "o": [24000, 24100],
+    "h": [24500, 24600],
+    "l": [23900, 24000],
+    "c": [24236, 24300],
+    "v": [1000, 2000],
+}]
+
+
+@pytest.fixture(autouse=True)
+def _bypass_quota(monkeypatch):
+    """Keep mocked requests out of the shared vnai rate-limit quota."""
+    from vnai.beam.quota import guardian
+    monkeypatch.setattr(guardian, "verify", lambda *args, **kwargs: True)
+
+
+def _mock_chart_transport(httpx, failing=()):
+    """httpx transport answering OHLC chart requests per symbol."""
+    def handler(request):
+        symbol = json.loads(request.content)['symbols'][0]
+        if symbol in failing:
+            return httpx.Response(500)
+        return httpx.Response(
+            200, json=[dict(_OHLC_RESPONSE[0], symbol=symbol)]
+        )
+    return httpx.MockTransport(handler)
+
+
 @pytest.mark.unit
 @pytest.mark.explorer
 @pytest.mark.vci
@@ -75,3 +114,330 @@ class TestVCIQuote:
                 show_log=False
             )
             assert quote.symbol == symbol
+
+    def test_vci_quote_history_invalid_date_format(self):
+        """Test VCI Quote rejects malformed dates before any request."""
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        with pytest.raises(ValueError):
+            quote.history(start='01/01/2024', end='2024-01-31')
+
+    @pytest.mark.parametrize('end', [
+        '2024-01-05T10:00:00+07:00',
+        '20240105',
+        '2024-W02-1',
+    ])
+    def test_vci_quote_history_rejects_other_iso_formats(self, end):
+        """Test only YYYY-MM-DD and YYYY-MM-DD HH:MM:SS are accepted."""
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        with pytest.raises(ValueError, match="Định dạng ngày không hợp lệ"):
+            quote.history(start='2024-01-01', end=end)
+
+    def test_vci_quote_history_unpadded_dates(self, monkeypatch):
+        """Test unpadded dates resolve to the same range as padded ones."""
+        calls = []
+
+        def mock_send_request(*args, **kwargs):
+            calls.append(kwargs['payload'])
+            return _OHLC_RESPONSE
+
+        monkeypatch.setattr(vci_quote, "send_request", mock_send_request)
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        quote.history(start='2024-01-01', end='2024-01-05')
+        quote.history(start='2024-1-1', end='2024-01-5')
+
+        assert calls[0] == calls[1]
+
+    def test_vci_quote_history_column_arrays(self, monkeypatch):
+        """Test VCI Quote history transforms the column-array response."""
+        def mock_send_request(*args, **kwargs):
+            return _OHLC_RESPONSE
+
+        monkeypatch.setattr(
+            "vnstock.explorer.vci.quote.send_request", mock_send_request
+        )
+
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        df = quote.history(start='2024-01-01', end='2024-01-05', floating=1)
+
+        assert list(df.columns) == [
+            'time', 'open', 'high', 'low', 'close', 'volume'
+        ]
+        assert len(df) == 2
+        assert df['close'].iloc[0] == 24.2
+        assert pd.api.types.is_datetime64_any_dtype(df['time'])
+
+    def test_vci_quote_history_floating_none(self, monkeypatch):
+        """Test floating=None falls back to two decimals."""
+        monkeypatch.setattr(
+            vci_quote, "send_request", lambda *args, **kwargs: _OHLC_RESPONSE
+        )
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        df = quote.history(start='2024-01-01', end='2024-01-05', floating=None)
+
+        assert df['close'].tolist() == [24.24, 24.3]
+
+    def test_vci_quote_history_response_cache(self, monkeypatch):
+        """Test identical history calls reuse the cached response."""
+        calls = []
+
+        def mock_send_request(*args, **kwargs):
+            calls.append(kwargs['payload'])
+            return _OHLC_RESPONSE
+
+        monkeypatch.setattr(vci_quote, "send_request", mock_send_request)
+        monkeypatch.setattr(vci_quote, "_RESPONSE_CACHE", OrderedDict())
+        monkeypatch.setattr(vci_quote, "_PYARROW_AVAILABLE", False)
+        set_config(VnstockConfig(cache=CacheConfig(enabled=True)))
+        try:
+            quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+            quote.history(start='2024-01-01', end='2024-01-05')
+            quote.history(start='2024-01-01', end='2024-01-05')
+            quote.history(start='2024-01-02', end='2024-01-05')
+        finally:
+            set_config(VnstockConfig())
+
+        assert len(calls) == 2
+
+    def test_vci_quote_response_cache_threads(self, monkeypatch):
+        """Test the response cache tolerates concurrent eviction."""
+        monkeypatch.setattr(
+            vci_quote, "send_request", lambda **kwargs: kwargs['payload']
+        )
+        monkeypatch.setattr(vci_quote, "_RESPONSE_CACHE", OrderedDict())
+        set_config(VnstockConfig(cache=CacheConfig(enabled=True, max_size=2)))
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(
+                    lambda i: vci_quote._cached_send_request(
+                        'url', {'n': i % 5}, ttl=60
+                    ),
+                    range(2000)
+                ))
+        finally:
+            set_config(VnstockConfig())
+
+        assert results == [{'n': i % 5} for i in range(2000)]
+        assert len(vci_quote._RESPONSE_CACHE) <= 2
+
+    def test_vci_quote_history_disk_cache(self, monkeypatch, tmp_path):
+        """Test completed ranges round-trip through the parquet cache."""
+        pytest.importorskip('pyarrow')
+        calls = []
+        paths = []
+
+        def mock_send_request(*args, **kwargs):
+            calls.append(kwargs['payload'])
+            return _OHLC_RESPONSE
+
+        def mock_cache_path(*args):
+            paths.append(args)
+            return tmp_path / 'ohlc.parquet'
+
+        monkeypatch.setattr(vci_quote, "send_request", mock_send_request)
+        monkeypatch.setattr(vci_quote, "_history_cache_path", mock_cache_path)
+        # ttl=0 turns the in-process cache off so only the disk cache acts
+        set_config(VnstockConfig(cache=CacheConfig(enabled=True, ttl=0)))
+        try:
+            quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+            fresh = quote.history(start='2024-01-01', end='2024-01-05')
+            cached = quote.history(start='2024-01-01', end='2024-01-05')
+            # Ranges reaching today are still changing: never cached
+            quote.history(count_back=2)
+        finally:
+            set_config(VnstockConfig())
+
+        assert len(calls) == 2
+        assert len(paths) == 2
+        assert (tmp_path / 'ohlc.parquet').exists()
+        pd.testing.assert_frame_equal(cached, fresh)
+        assert cached['time'].dtype == fresh['time'].dtype
+        assert cached.name == 'ACB'
+        assert cached.category == fresh.category
+        assert cached.source == 'VCI'
+
+    def test_vci_quote_history_many_single_request(self, monkeypatch):
+        """Test history_many fetches all symbols in one POST."""
+        calls = []
+
+        def mock_send_request(*args, **kwargs):
+            calls.append(kwargs['payload'])
+            return [
+                dict(_OHLC_RESPONSE[0], symbol='VCB'),
+                dict(_OHLC_RESPONSE[0], symbol='ACB'),
+            ]
+
+        monkeypatch.setattr(vci_quote, "send_request", mock_send_request)
+        sessions = []
+        monkeypatch.setattr(
+            vci_quote.requests, "Session", lambda: sessions.append(1)
+        )
+
+        result = Quote.history_many(
+            ['ACB', 'VCB', 'TCB'], start='2024-01-01', end='2024-01-05'
+        )
+
+        assert len(calls) == 1
+        assert calls[0]['symbols'] == ['ACB', 'VCB', 'TCB']
+        assert set(result) == {'ACB', 'VCB'}
+        assert len(result['ACB']) == 2
+        # Only the instance that sends the request opens a session
+        assert len(sessions) == 1
+
+    def test_vci_quote_history_many_keys_by_input_symbol(self, monkeypatch):
+        """Test history_many keys results by the symbols passed in."""
+        calls = []
+
+        def mock_send_request(*args, **kwargs):
+            calls.append(kwargs['payload'])
+            return [
+                dict(_OHLC_RESPONSE[0], symbol='HNXIndex'),
+                dict(_OHLC_RESPONSE[0], symbol='ACB'),
+            ]
+
+        monkeypatch.setattr(vci_quote, "send_request", mock_send_request)
+
+        result = Quote.history_many(
+            ['HNXINDEX', 'acb'], start='2024-01-01', end='2024-01-05'
+        )
+
+        assert calls[0]['symbols'] == ['HNXIndex', 'ACB']
+        assert set(result) == {'HNXINDEX', 'acb'}
+
+    def test_vci_quote_history_invalid_interval(self):
+        """Test VCI Quote rejects intervals it does not support."""
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        with pytest.raises(ValueError):
+            quote.history(start='2024-01-01', end='2024-01-31', interval='4h')
+
+    def test_vci_quote_history_invalid_backend(self):
+        """Test VCI Quote rejects unknown DataFrame backends."""
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        with pytest.raises(ValueError):
+            quote.history(
+                start='2024-01-01', end='2024-01-31', backend='polars'
+            )
+
+    def test_vci_quote_intraday_arrow_backend(self, monkeypatch):
+        """Test backend='arrow' converts text columns and keeps metadata."""
+        pytest.importorskip("pyarrow")
+        response = {"data": [
+            {"truncTime": "1704173400", "matchPrice": "24100",
+             "matchVol": "100", "matchType": "b", "id": "1"},
+        ]}
+        monkeypatch.setattr(
+            vci_quote, "send_request", lambda *args, **kwargs: response
+        )
+        monkeypatch.setattr(
+            vci_quote, "_market_status_at",
+            lambda *args: {'is_trading_hour': True, 'data_status': 'open',
+                           'time': ''}
+        )
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        df = quote.intraday(backend='arrow')
+
+        assert df['match_type'].dtype == 'string[pyarrow]'
+        assert df['id'].dtype == 'string[pyarrow]'
+        assert df['price'].dtype == 'float64'
+        assert df.source == 'VCI'
+        assert df.category == 'stock'
+
+    def test_vci_intraday_to_df_mixed_record_keys(self):
+        """Test intraday columns come from all records, not just the first."""
+        data = [
+            {"truncTime": "1704173400", "matchPrice": "24100",
+             "matchVol": "100", "matchType": "b"},
+            {"truncTime": "1704173460", "matchPrice": "24200",
+             "matchVol": "200", "matchType": "s", "id": "2"},
+        ]
+        df = intraday_to_df(
+            data, _INTRADAY_MAP, _INTRADAY_DTYPE,
+            symbol='ACB', asset_type='stock', source='VCI'
+        )
+
+        assert list(df.columns) == [
+            'time', 'price', 'volume', 'match_type', 'id'
+        ]
+        assert df['id'].iloc[1] == '2'
+        assert df['price'].tolist() == [24.1, 24.2]
+
+    def test_vci_quote_history_async_with_mock_transport(self):
+        """Test history_async decodes the response from a shared client."""
+        httpx = pytest.importorskip("httpx")
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+
+        async def fetch():
+            async with httpx.AsyncClient(
+                transport=_mock_chart_transport(httpx)
+            ) as client:
+                return await quote.history_async(
+                    start='2024-01-01', end='2024-01-05', client=client
+                )
+
+        df = asyncio.run(fetch())
+
+        assert len(df) == 2
+        assert df['close'].tolist() == [24.24, 24.3]
+
+    def test_vci_quote_history_async_malformed_body(self):
+        """Test history_async reports an undecodable body as ConnectionError."""
+        httpx = pytest.importorskip("httpx")
+        quote = Quote(symbol='ACB', random_agent=False, show_log=False)
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b'not json')
+        )
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await quote.history_async(
+                    start='2024-01-01', end='2024-01-05', client=client
+                )
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(fetch())
+
+    def test_vci_quote_history_many_async_partial_failure(self, monkeypatch):
+        """Test history_many_async drops and logs symbols that fail."""
+        httpx = pytest.importorskip("httpx")
+        transport = _mock_chart_transport(httpx, failing={'VCB'})
+        warnings = []
+
+        class MockAsyncClient(httpx.AsyncClient):
+            def __init__(self, **kwargs):
+                kwargs.pop('http2', None)
+                super().__init__(transport=transport, **kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", MockAsyncClient)
+        monkeypatch.setattr(vci_quote.logger, "warning", warnings.append)
+        reserved = []
+        monkeypatch.setattr(
+            vci_quote, "_reserve_quota", lambda: reserved.append(1)
+        )
+
+        result = asyncio.run(Quote.history_many_async(
+            ['ACB', 'VCB'], start='2024-01-01', end='2024-01-05'
+        ))
+
+        assert set(result) == {'ACB'}
+        assert len(result['ACB']) == 2
+        assert len(warnings) == 1 and warnings[0].startswith('VCB')
+        # Every request goes through the VCI quota guard
+        assert len(reserved) == 2
+
+    def test_vci_quote_history_many_async_invalid_arguments(self):
+        """Test history_many_async raises on bad arguments like history_many."""
+        pytest.importorskip("httpx")
+        with pytest.raises(ValueError):
+            asyncio.run(Quote.history_many_async(
+                ['ACB', 'VCB'], start='01/01/2024', end='2024-01-05'
+            ))
+
+    def test_vci_quote_history_async_rejects_proxy(self):
+        """Test history_async refuses proxy configurations."""
+        quote = Quote(
+            symbol='ACB', random_agent=False, show_log=False,
+            proxy_list=['http://127.0.0.1:8080']
+        )
+        with pytest.raises(ValueError):
+            asyncio.run(quote.history_async(
+                start='2024-01-01', end='2024-01-05'
+            ))
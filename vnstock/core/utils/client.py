@@ -14,7 +14,7 @@ Functions:
 import requests
 import json
 import random
-from typing import Dict, Any, Optional, Union, List
+from typing import Callable, Dict, Any, Optional, Union, List
 from enum import Enum
 from pydantic import BaseModel
 from vnstock.core.utils.logger import get_logger
@@ -120,6 +120,8 @@ def send_request(
     proxy_list: Optional[List[str]] = None,
     proxy_mode: Union[ProxyMode, str] = ProxyMode.TRY,
     request_mode: Union[RequestMode, str] = RequestMode.DIRECT,
+    session: Optional[requests.Session] = None,
+    json_loader: Optional[Callable[[bytes], Any]] = None,
 ) -> Dict[str, Any]:
     """
     Central interface for all request sending modes.
@@ -139,6 +141,10 @@ def send_request(
           (for PROXY mode)
         proxy_mode (Union[ProxyMode, str]): Proxy usage mode
         request_mode (Union[RequestMode, str]): Request sending mode
+        session (Optional[requests.Session]): Session to reuse pooled
+          connections across calls
+        json_loader (Optional[Callable[[bytes], Any]]): Decoder for the
+          raw response body (e.g. orjson.loads); defaults to response.json()
         
     Returns:
         Dict[str, Any]: Returned JSON data
@@ -192,7 +198,7 @@ def send_request(
                     proxies = build_proxy_dict(proxy_url)
                     return send_request_direct(
                         url, headers, method, params, payload,
-                        timeout, proxies
+                        timeout, proxies, session, json_loader
                     )
                 except ConnectionError as e:
                     last_exception = e
@@ -220,7 +226,7 @@ def send_request(
                 logger.info(msg)
             return send_request_direct(
                 url, headers, method, params, payload, timeout,
-                proxies
+                proxies, session, json_loader
             )
     else:  # RequestMode.DIRECT
         # Send direct request without proxy
@@ -228,7 +234,7 @@ def send_request(
             logger.info("Sending direct request (no proxy)")
         return send_request_direct(
             url, headers, method, params, payload, timeout,
-            proxies=None
+            proxies=None, session=session, json_loader=json_loader
         )
 
 
@@ -239,7 +245,9 @@ def send_request_direct(
     params: Optional[Dict] = None,
     payload: Optional[Union[Dict, str]] = None,
     timeout: int = 30,
-    proxies: Optional[Dict[str, str]] = None
+    proxies: Optional[Dict[str, str]] = None,
+    session: Optional[requests.Session] = None,
+    json_loader: Optional[Callable[[bytes], Any]] = None
 ) -> Dict[str, Any]:
     """
     Send request directly to endpoint without special proxy.
@@ -252,6 +260,10 @@ def send_request_direct(
         payload (Optional[Union[Dict, str]]): Data to send (POST)
         timeout (int): Timeout in seconds
         proxies (Optional[Dict[str, str]]): Proxy dict if any
+        session (Optional[requests.Session]): Session to send through;
+          defaults to the module-level requests functions
+        json_loader (Optional[Callable[[bytes], Any]]): Decoder for the
+          raw response body; defaults to response.json()
         
     Returns:
         Dict[str, Any]: Returned JSON data
@@ -259,10 +271,12 @@ def send_request_direct(
     Raises:
         ConnectionError: If request fails or returns error code
     """
+    # A session keeps the TCP/TLS connection alive between calls
+    http = session if session is not None else requests
     try:
         # Handle GET/POST
         if method.upper() == "GET":
-            response = requests.get(
+            response = http.get(
                 url, headers=headers, params=params,
                 timeout=timeout, proxies=proxies
             )
@@ -280,7 +294,7 @@ def send_request_direct(
                     raise ValueError(msg)
             else:
                 data_arg = None
-            response = requests.post(
+            response = http.post(
                 url, headers=headers, data=data_arg,
                 timeout=timeout, proxies=proxies
             )
@@ -291,7 +305,14 @@ def send_request_direct(
                 f"{response.status_code} - {response.reason}"
             )
             raise ConnectionError(msg)
-        return response.json()
+        if json_loader is None:
+            return response.json()
+        try:
+            return json_loader(response.content)
+        except ValueError as e:
+            error_msg = f"API request failed: {str(e)}"
+            logger.error(error_msg)
+            raise ConnectionError(error_msg)
     except requests.exceptions.RequestException as e:
         error_msg = f"API request failed: {str(e)}"
         logger.error(error_msg)
@@ -143,6 +143,20 @@ def process_match_types(df, asset_type, source):
     
     return df
 
+def _typed_array(values: Any, dtype: Optional[str]) -> Any:
+    """
+    Convert a raw column to a NumPy array of a known numeric dtype.
+
+    Values that cannot be cast (e.g. missing entries in an int column) are
+    returned unchanged and left to pandas inference.
+    """
+    if dtype not in ("float64", "int64"):
+        return values
+    try:
+        return np.asarray(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return values
+
 def ohlc_to_df(
     data: Dict[str, Any],
     column_map: Dict[str, str],
@@ -165,15 +179,17 @@ def ohlc_to_df(
         # Apply column mapping directly through rename
         df.rename(columns=column_map, inplace=True)
     else:
-        # Other sources with dict data
-        # Select and rename columns using dictionary comprehension
-        columns_of_interest = {
-            key: column_map[key]
-            for key in column_map.keys()
-            if key in data
-        }
-        df = pd.DataFrame(data)[columns_of_interest.keys()].rename(
-            columns=column_map
+        # Other sources with dict data (column arrays): build each mapped
+        # column as a typed array so pandas skips per-column inference
+        df = pd.DataFrame(
+            {
+                column_map[key]: _typed_array(
+                    data[key], dtype_map.get(column_map[key])
+                )
+                for key in column_map
+                if key in data
+            },
+            copy=False
         )
     
     # Ensure all required columns exist
@@ -194,21 +210,25 @@ def ohlc_to_df(
     # Time conversion - handle different formats based on source
     if 'time' in df.columns:
         if source == 'VCI':
-            # VCI uses integer timestamps
-            df['time'] = pd.to_datetime(df['time'].astype(int), unit='s').dt.tz_localize('UTC')
-            df['time'] = df['time'].dt.tz_convert('Asia/Ho_Chi_Minh')
+            # VCI uses epoch-second timestamps: reinterpret the int64 array
+            # as datetime64[s] (no parsing), then widen to nanoseconds
+            epoch = df['time'].to_numpy(dtype='int64')
+            stamps = epoch.view('datetime64[s]').astype('datetime64[ns]')
+            df['time'] = pd.DatetimeIndex(stamps, tz='UTC').tz_convert(
+                'Asia/Ho_Chi_Minh'
+            )
         else:
             # TCBS and others might use string formats
             df['time'] = pd.to_datetime(df['time'], errors='coerce')
     
-    # Price scaling for non-index/derivative assets
+    # Price scaling (non-index/derivative assets) and rounding, done in
+    # place on one contiguous float64 block instead of two frame passes
+    price_columns = ["open", "high", "low", "close"]
+    prices = df[price_columns].to_numpy(dtype="float64", copy=True)
     if asset_type not in ["index", "derivative"]:
-        df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].div(1000)
-    
-    # Round price columns
-    df[["open", "high", "low", "close"]] = (
-        df[["open", "high", "low", "close"]].round(floating)
-    )
+        np.divide(prices, 1000, out=prices)
+    np.round(prices, floating, out=prices)
+    df[price_columns] = prices
 
     # Resample if needed - use shared utility for consistency
     if resample_map and interval not in ["1m", "1H", "1D"]:
@@ -257,21 +277,23 @@ def intraday_to_df(
     if not data:
         empty_df = pd.DataFrame(columns=list(column_map.values()))
         empty_df.attrs['symbol'] = symbol
+        empty_df.attrs['category'] = asset_type
+        empty_df.attrs['source'] = source
         empty_df.category = asset_type
         empty_df.source = source
         return empty_df
 
-    df = pd.DataFrame(data)
-
-    # --- Select and rename columns ---
-    available = [c for c in column_map if c in df.columns]
+    # --- Select and rename columns in a single construction ---
+    # Records may carry different keys, take the union of all of them
+    keys = set().union(*data)
+    available = [c for c in column_map if c in keys]
     if not available:
         raise ValueError(
             f"Expected columns {list(column_map)} not found, "
-            f"got {df.columns.tolist()}"
+            f"got {sorted(keys)}"
         )
-    df = df[available].rename(columns={k: column_map[k]
-                                       for k in available})
+    df = pd.DataFrame(data, columns=available)
+    df.columns = [column_map[c] for c in available]
 
     # --- Clean and convert to numeric ---
     for col in ('price', 'volume'):
@@ -347,6 +369,8 @@ def intraday_to_df(
 
     # --- Metadata ---
     df.attrs['symbol'] = symbol
+    df.attrs['category'] = asset_type
+    df.attrs['source'] = source
     df.category = asset_type
     df.source = source
 
@@ -12,7 +12,6 @@ from vnstock.core.utils.logger import get_logger
 from vnstock.core.utils.user_agent import get_headers
 from vnstock.core.utils.client import send_request, ProxyConfig
 from vnstock.core.utils.transform import drop_cols_by_pattern, reorder_cols
-from vnstock.common import indices as market_indices
 from vnai import optimize_execution
 logger = get_logger(__name__)
 
@@ -264,6 +263,8 @@ class Listing:
             pd.DataFrame: Columns [symbol, name, description, full_name,
                                    group, index_id, sector_id (for sectors)]
         """
+        # Lazy import: vnstock.common loads the charting stack on import
+        from vnstock.common import indices as market_indices
         return market_indices.get_all_indices()
 
     def indices_by_group(self, group: str) -> Optional[pd.DataFrame]:
@@ -277,6 +278,8 @@ class Listing:
             pd.DataFrame: Danh sách chỉ số trong nhóm hoặc None
                           (Sector indices include sector_id mapping)
         """
+        # Lazy import: vnstock.common loads the charting stack on import
+        from vnstock.common import indices as market_indices
         return market_indices.get_indices_by_group(group)
 
 
@@ -1,28 +1,45 @@
 """History module for VCI."""
 
-from typing import Optional, Union
-from datetime import datetime
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from datetime import date, datetime
 import pandas as pd
+import requests
 from vnai import optimize_execution
 from vnstock.core.types import TimeFrame
 from vnstock.core.utils.interval import normalize_interval
 from .const import (
-    _TRADING_URL, _INTERVAL_MAP, _RESAMPLE_MAP,
+    _TRADING_URL, _CHART_URL, _INTERVAL_MAP, _RESAMPLE_MAP,
     _OHLC_MAP, _OHLC_DTYPE, _INTRADAY_URL,
     _INTRADAY_MAP, _INTRADAY_DTYPE, _PRICE_DEPTH_MAP, _INDEX_MAPPING
 )
 from vnstock.core.models import TickerModel
+from vnstock.core.settings import get_config
 from vnstock.core.utils.logger import get_logger
 from vnstock.core.utils.market import trading_hours
 from vnstock.core.utils.parser import get_asset_type, convert_time_flexible
 from vnstock.core.utils.validation import validate_symbol
 from vnstock.core.utils.user_agent import get_headers
-from vnstock.core.utils.client import send_request, ProxyConfig
+from vnstock.core.utils.client import send_request, ProxyConfig, RequestMode
 from vnstock.core.utils.transform import ohlc_to_df, intraday_to_df
 from vnstock.core.utils.lookback import get_start_date_from_lookback, interpret_lookback_length
 
 logger = get_logger(__name__)
 
+# Large OHLC payloads decode noticeably faster with orjson when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # TimeFrame to interval key mapping
 # Standard format: m/1m=minute, h/1H=hour, d/1D=day, w/1W=week, M/1M=month
 _TIMEFRAME_MAP = {
@@ -36,6 +53,259 @@ _TIMEFRAME_MAP = {
     '30m': '30m'
 }
 
+# Supported VCI interval keys, precomputed for membership checks and errors
+_INTERVAL_KEYS = frozenset(_INTERVAL_MAP)
+_VALID_INTERVALS = ', '.join(_INTERVAL_MAP)
+
+
+def _parse_datetime(value: str) -> tuple:
+    """
+    Parse 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'.
+
+    Returns (datetime, date_only). date.fromisoformat (implemented in C)
+    is the fast path for zero-padded dates; strptime still accepts the
+    unpadded forms such as '2024-1-5'. The separator check keeps out the
+    other ISO forms fromisoformat accepts (e.g. week dates 2024-W02-1).
+    """
+    try:
+        if len(value) == 10 and value[4] == value[7] == '-':
+            parsed = date.fromisoformat(value)
+            return datetime(parsed.year, parsed.month, parsed.day), True
+    except (TypeError, ValueError):
+        pass
+    for fmt, date_only in (("%Y-%m-%d", True), ("%Y-%m-%d %H:%M:%S", False)):
+        try:
+            return datetime.strptime(value, fmt), date_only
+        except (TypeError, ValueError):
+            continue
+    raise ValueError(
+        f"Định dạng ngày không hợp lệ: {value}. "
+        f"Sử dụng định dạng YYYY-MM-DD hoặc "
+        f"YYYY-MM-DD HH:MM:SS"
+    )
+
+
+@lru_cache(maxsize=32)
+def _resolve_interval(interval: Union[str, TimeFrame, None]) -> tuple:
+    """
+    Normalize an interval once per distinct input.
+
+    Returns (TimeFrame, interval key), the key is None when VCI has no
+    matching interval.
+    """
+    timeframe = normalize_interval(interval)
+    interval_key = _TIMEFRAME_MAP.get(timeframe.value)
+    if interval_key not in _INTERVAL_KEYS:
+        interval_key = None
+    return timeframe, interval_key
+
+
+@lru_cache(maxsize=512)
+def _business_day_count(start_ordinal: int, end_ordinal: int) -> int:
+    """
+    Count business days (Mon-Fri) between two dates, keyed on ordinals so
+    repeated calls over the same range skip building a DatetimeIndex.
+    """
+    return len(pd.bdate_range(
+        start=date.fromordinal(start_ordinal),
+        end=date.fromordinal(end_ordinal)
+    ))
+
+
+def _first_symbol_data(json_data):
+    """
+    Unwrap an OHLC chart response down to the data of the first symbol.
+    """
+    # Handle both list and dict responses
+    if isinstance(json_data, dict) and 'data' in json_data:
+        # API returns dict with 'data' key
+        json_data = json_data['data']
+
+    # Column-array responses hold one entry per requested symbol
+    if (
+        isinstance(json_data, list) and
+        len(json_data) > 0 and
+        isinstance(json_data[0], dict) and
+        isinstance(json_data[0].get('o'), list)
+    ):
+        json_data = json_data[0]
+    return json_data
+
+
+def _import_httpx():
+    """Import httpx on demand; it is only needed by the async API."""
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "Các phương thức async cần thư viện httpx. "
+            "Cài đặt bằng lệnh: pip install httpx"
+        )
+    return httpx
+
+
+async def _post_json_async(
+    client,
+    url: str,
+    headers: dict,
+    payload: dict,
+    timeout: int = 30
+):
+    """POST a JSON payload with an httpx.AsyncClient and decode the reply."""
+    httpx = _import_httpx()
+    try:
+        response = await client.post(
+            url, headers=headers, content=json.dumps(payload),
+            timeout=timeout
+        )
+    except httpx.HTTPError as e:
+        error_msg = f"API request failed: {str(e)}"
+        logger.error(error_msg)
+        raise ConnectionError(error_msg)
+    if response.status_code != 200:
+        raise ConnectionError(
+            f"Failed to fetch data: "
+            f"{response.status_code} - {response.reason_phrase}"
+        )
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        error_msg = f"API request failed: {str(e)}"
+        logger.error(error_msg)
+        raise ConnectionError(error_msg)
+
+
+@optimize_execution("VCI")
+def _reserve_quota() -> None:
+    """
+    Consume one slot of the VCI quota before an async request.
+
+    The vnai guard only wraps synchronous callables, so async requests
+    pass through this no-op to be counted and throttled like history().
+    """
+
+
+@lru_cache(maxsize=4)
+def _cached_headers(data_source: str) -> dict:
+    """Build the fixed (non-random) request headers once per data source."""
+    return get_headers(data_source=data_source, random_agent=False)
+
+
+@lru_cache(maxsize=1)
+def _market_status_at(market: str, bucket: int) -> dict:
+    """
+    Memoize trading_hours per one-second bucket; market status cannot change
+    faster than that. Call with int(time.monotonic()) as the bucket.
+    """
+    return trading_hours(market)
+
+
+# In-process response cache: (url, payload) -> (expires_at, json_data)
+_RESPONSE_CACHE: OrderedDict = OrderedDict()
+# Guards _RESPONSE_CACHE: Quote calls are often spread over threads
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Intraday matches change continuously, keep them only briefly
+_INTRADAY_CACHE_TTL = 5
+
+
+def _cached_send_request(url: str, payload: dict, ttl: float, **kwargs):
+    """
+    Call send_request through a TTL-bound in-process cache keyed by
+    URL and payload. Active only when the global cache config is enabled.
+    """
+    cache_config = get_config().cache
+    if not cache_config.enabled or ttl <= 0:
+        return send_request(url=url, payload=payload, **kwargs)
+
+    key = (url, json.dumps(payload, sort_keys=True))
+    now = time.monotonic()
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            _RESPONSE_CACHE.move_to_end(key)
+            return entry[1]
+
+    # The request itself runs outside the lock
+    data = send_request(url=url, payload=payload, **kwargs)
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = (now + ttl, data)
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > cache_config.max_size:
+            _RESPONSE_CACHE.popitem(last=False)
+    return data
+
+
+# pyarrow (optional dependency) backs the parquet disk cache and the
+# arrow DataFrame backend
+_PYARROW_AVAILABLE = find_spec('pyarrow') is not None
+
+# Completed OHLC ranges never change, keep them on disk for 90 days
+_HISTORY_CACHE_TTL = 90 * 24 * 3600
+
+
+def _check_backend(backend: Optional[str]) -> None:
+    """Validate the DataFrame backend before any request is sent."""
+    if backend not in (None, 'numpy', 'arrow'):
+        raise ValueError(
+            f"Giá trị backend không hợp lệ: {backend}. "
+            f"Vui lòng chọn: numpy, arrow"
+        )
+    if backend == 'arrow' and not _PYARROW_AVAILABLE:
+        raise ImportError(
+            "backend='arrow' cần thư viện pyarrow. "
+            "Cài đặt bằng lệnh: pip install pyarrow"
+        )
+
+
+def _apply_backend(df: pd.DataFrame, backend: Optional[str]) -> pd.DataFrame:
+    """
+    Convert text columns to pyarrow-backed strings when backend='arrow'.
+
+    Columns are replaced in place so DataFrame metadata is preserved.
+    """
+    if backend != 'arrow':
+        return df
+    text_columns = df.select_dtypes(include=['object', 'string']).columns
+    for column in text_columns:
+        df[column] = df[column].astype('string[pyarrow]')
+    return df
+
+
+def _history_cache_path(
+    symbol: str,
+    interval: str,
+    end_stamp: int,
+    count_back: int,
+    floating: int
+) -> Path:
+    """Build the parquet file path for a cached history request."""
+    from vnstock.core.config.const import PROJECT_DIR
+    file_name = f"{symbol}_{interval}_{end_stamp}_{count_back}_{floating}"
+    return PROJECT_DIR / 'cache' / 'vci_ohlc' / f"{file_name}.parquet"
+
+
+def _read_history_cache(path: Path) -> Optional[pd.DataFrame]:
+    """Return the cached DataFrame if the file exists and is not expired."""
+    try:
+        if time.time() - path.stat().st_mtime > _HISTORY_CACHE_TTL:
+            return None
+        return pd.read_parquet(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Không đọc được cache {path}: {e}")
+        return None
+
+
+def _write_history_cache(df: pd.DataFrame, path: Path) -> None:
+    """Persist a history DataFrame; failures never break the request."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path, compression='zstd', index=False)
+    except Exception as e:
+        logger.debug(f"Không ghi được cache {path}: {e}")
+
 
 class Quote:
     """
@@ -63,12 +333,19 @@ class Quote:
         self._history = None  # Cache for historical data
         self.asset_type = get_asset_type(self.symbol)
         self.base_url = _TRADING_URL
-        self.headers = get_headers(
-            data_source=self.data_source,
-            random_agent=random_agent
-        )
+        if random_agent:
+            self.headers = get_headers(
+                data_source=self.data_source,
+                random_agent=True
+            )
+        else:
+            # Copy so per-instance changes never leak into the shared cache
+            self.headers = dict(_cached_headers(self.data_source))
         self.interval_map = _INTERVAL_MAP
         self.show_log = show_log
+        # Pooled connection reused by every request of this instance,
+        # opened on the first request (see _get_session)
+        self._session: Optional[requests.Session] = None
         
         # Handle proxy configuration
         if proxy_config is None:
@@ -106,6 +383,15 @@ class Quote:
             )
         return _INDEX_MAPPING[self.symbol]
 
+    def _get_session(self) -> requests.Session:
+        """
+        Return the pooled connection of this instance, creating it on first
+        use so instances that never send a request do not open one.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+        return self._session
+
     def _input_validation(
         self,
         start: str,
@@ -115,7 +401,7 @@ class Quote:
         """
         Validate input data and return TickerModel and interval_key.
         """
-        timeframe = normalize_interval(interval)
+        timeframe, interval_key = _resolve_interval(interval)
         ticker = TickerModel(
             symbol=self.symbol,
             start=start,
@@ -123,45 +409,27 @@ class Quote:
             interval=str(timeframe)
         )
 
-        interval_key = _TIMEFRAME_MAP.get(timeframe.value)
-        if (
-            interval_key is None or
-            interval_key not in self.interval_map.keys()
-        ):
-            valid_intervals = ', '.join(self.interval_map.keys())
+        if interval_key is None:
             msg = (
                 f"Giá trị interval không hợp lệ: {interval}. "
-                f"Vui lòng chọn: {valid_intervals}"
+                f"Vui lòng chọn: {_VALID_INTERVALS}"
             )
             raise ValueError(msg)
 
         return ticker, interval_key
 
-    @optimize_execution("VCI")
-    def history(
+    def _build_ohlc_request(
         self,
-        start: Optional[str] = None,
-        end: Optional[str] = None,
-        interval: Optional[str] = "1D",
-        show_log: Optional[bool] = False,
-        count_back: Optional[int] = None,
-        floating: Optional[int] = 2,
-        length: Optional[Union[str, int]] = None
-    ) -> pd.DataFrame:
+        start: Optional[str],
+        end: Optional[str],
+        interval: Optional[str],
+        count_back: Optional[int],
+        length: Optional[Union[str, int]]
+    ) -> tuple:
         """
-        Tải lịch sử giá của mã chứng khoán từ nguồn dữ liệu VCI.
+        Resolve the requested range and build the OHLC chart request.
 
-        Tham số:
-            - start (tùy chọn): thời gian bắt đầu lấy dữ liệu.
-              Bắt buộc nếu không có length hoặc count_back.
-            - end (tùy chọn): thời gian kết thúc lấy dữ liệu.
-              Mặc định là None (hiện tại).
-            - interval (tùy chọn): Khung thời gian. Mặc định "1D".
-            - length (tùy chọn): Khoảng thời gian phân tích (vd: '3M', 150, '150').
-              Nhận giá trị chuỗi (vd 3M), số ngày (int/str), hoặc số bars (vd '100b').
-            - count_back (tùy chọn): Số lượng nến (bars) cần lấy.
-            - show_log (tùy chọn): Hiển thị log.
-            - floating (tùy chọn): Số chữ số thập phân.
+        Returns (url, payload, interval_key, end_time).
         """
         # Calculate start if not provided
         if start is None:
@@ -198,45 +466,15 @@ class Quote:
             interval
         )
 
-        # Parse start time - support both date and datetime formats
-        try:
-            # Try datetime format first
-            start_time = datetime.strptime(
-                ticker.start,
-                "%Y-%m-%d %H:%M:%S"
-            )
-        except ValueError:
-            try:
-                # Try date only format
-                start_time = datetime.strptime(ticker.start, "%Y-%m-%d")
-            except ValueError:
-                raise ValueError(
-                    f"Định dạng ngày không hợp lệ: {ticker.start}. "
-                    f"Sử dụng định dạng YYYY-MM-DD hoặc "
-                    f"YYYY-MM-DD HH:MM:SS"
-                )
+        # Parse start/end - support both date and datetime formats
+        start_time, _ = _parse_datetime(ticker.start)
 
         # Calculate end timestamp
         if end is not None:
-            try:
-                # Try datetime format first
-                end_time = datetime.strptime(
-                    ticker.end,
-                    "%Y-%m-%d %H:%M:%S"
-                )
-            except ValueError:
-                try:
-                    # Try date only format
-                    end_time = datetime.strptime(
-                        ticker.end,
-                        "%Y-%m-%d"
-                    ) + pd.Timedelta(days=1)
-                except ValueError:
-                    raise ValueError(
-                        f"Định dạng ngày không hợp lệ: {ticker.end}. "
-                        f"Sử dụng định dạng YYYY-MM-DD hoặc "
-                        f"YYYY-MM-DD HH:MM:SS"
-                    )
+            end_time, date_only = _parse_datetime(ticker.end)
+            if date_only:
+                # Date only: include the whole end day
+                end_time = end_time + pd.Timedelta(days=1)
 
             if start_time > end_time:
                 raise ValueError(
@@ -252,45 +490,138 @@ class Quote:
 
         # Calculate count_back automatically if not provided
         auto_count_back = 1000
-        business_days = pd.bdate_range(start=start_time, end=end_time)
 
         if count_back is None:
+            business_days = _business_day_count(
+                start_time.toordinal(),
+                end_time.toordinal()
+            )
             interval_mapped = interval_value
 
             if interval_mapped == "ONE_DAY":
                 # Count business days (excluding weekends)
-                auto_count_back = len(business_days) + 1
+                auto_count_back = business_days + 1
             elif interval_mapped == "ONE_HOUR":
                 # Business days * trading hours per day (5 hours for VN market: 9-11:30, 13-14:45 approx 5 bars of 1H)
-                auto_count_back = int(len(business_days) * 5 + 1)
+                auto_count_back = int(business_days * 5 + 1)
             elif interval_mapped == "ONE_MINUTE":
                 # Business days * trading minutes per day.
                 # Morning: 9:00-11:30 (150m)
                 # Afternoon: 13:00-14:45 (105m)
                 # Total: 255 minutes
-                auto_count_back = int(len(business_days) * 255 + 1)
+                auto_count_back = int(business_days * 255 + 1)
         else:
             auto_count_back = count_back
 
-        # Prepare request
-        url = f'{self.base_url}chart/OHLCChart/gap-chart'
+        url = f'{self.base_url}{_CHART_URL}'
         payload = {
             "timeFrame": interval_value,
             "symbols": [self.symbol],
             "to": end_stamp,
             "countBack": auto_count_back
         }
+        return url, payload, interval_key, end_time
+
+    def _ohlc_response_to_df(
+        self,
+        data,
+        interval_key: str,
+        floating: Optional[int]
+    ) -> pd.DataFrame:
+        """
+        Transform the OHLC chart data of this symbol into a DataFrame.
+        """
+        # VCI returns column arrays per symbol: pass them straight to
+        # ohlc_to_df instead of round-tripping through row records
+        if isinstance(data, dict) and isinstance(data.get('o'), list):
+            data = {key: data[key] for key in _OHLC_MAP} if data['o'] else None
+
+        if not data:
+            raise ValueError(
+                "Không tìm thấy dữ liệu. Vui lòng kiểm tra lại "
+                "mã chứng khoán hoặc thời gian truy xuất."
+            )
+
+        # Use the ohlc_to_df utility
+        return ohlc_to_df(
+            data=data,
+            column_map=_OHLC_MAP,
+            dtype_map=_OHLC_DTYPE,
+            symbol=self.symbol,
+            asset_type=self.asset_type,
+            source=self.data_source,
+            interval=interval_key,
+            # floating=None keeps the historical default of 2 decimals
+            floating=2 if floating is None else floating,
+            resample_map=_RESAMPLE_MAP
+        )
+
+    @optimize_execution("VCI")
+    def history(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: Optional[str] = "1D",
+        show_log: Optional[bool] = False,
+        count_back: Optional[int] = None,
+        floating: Optional[int] = 2,
+        length: Optional[Union[str, int]] = None,
+        backend: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Tải lịch sử giá của mã chứng khoán từ nguồn dữ liệu VCI.
+
+        Tham số:
+            - start (tùy chọn): thời gian bắt đầu lấy dữ liệu.
+              Bắt buộc nếu không có length hoặc count_back.
+            - end (tùy chọn): thời gian kết thúc lấy dữ liệu.
+              Mặc định là None (hiện tại).
+            - interval (tùy chọn): Khung thời gian. Mặc định "1D".
+            - length (tùy chọn): Khoảng thời gian phân tích (vd: '3M', 150, '150').
+              Nhận giá trị chuỗi (vd 3M), số ngày (int/str), hoặc số bars (vd '100b').
+            - count_back (tùy chọn): Số lượng nến (bars) cần lấy.
+            - show_log (tùy chọn): Hiển thị log.
+            - floating (tùy chọn): Số chữ số thập phân.
+            - backend (tùy chọn): 'arrow' để trả về các cột văn bản dạng
+              chuỗi pyarrow (tiết kiệm bộ nhớ). Mặc định None (NumPy).
+        """
+        _check_backend(backend)
+        url, payload, interval_key, end_time = self._build_ohlc_request(
+            start, end, interval, count_back, length
+        )
+
+        # Completed ranges are immutable: serve them from the disk cache
+        cache_path = None
+        today_start = datetime.combine(date.today(), datetime.min.time())
+        if (
+            _PYARROW_AVAILABLE and
+            get_config().cache.enabled and
+            end_time <= today_start
+        ):
+            cache_path = _history_cache_path(
+                self.symbol, interval_key, payload['to'],
+                payload['countBack'], floating
+            )
+            df = _read_history_cache(cache_path)
+            if df is not None:
+                df.name = self.symbol
+                df.category = self.asset_type
+                df.source = self.data_source
+                return _apply_backend(df, backend)
 
         # Use the send_request utility
-        json_data = send_request(
+        json_data = _cached_send_request(
             url=url,
+            payload=payload,
+            ttl=get_config().cache.ttl,
             headers=self.headers,
             method="POST",
-            payload=payload,
             show_log=show_log if show_log is not None else False,
             proxy_list=self.proxy_config.proxy_list,
             proxy_mode=self.proxy_config.proxy_mode,
-            request_mode=self.proxy_config.request_mode
+            request_mode=self.proxy_config.request_mode,
+            session=self._get_session(),
+            json_loader=_json_loads
         )
 
         # Debug: log response structure
@@ -301,52 +632,241 @@ class Quote:
             )
             logger.info(f"Response length: {data_len}")
 
-        # Handle both list and dict responses
-        if isinstance(json_data, list):
-            # API returns list of OHLC data directly
-            pass  # json_data is already in correct format
-        elif isinstance(json_data, dict) and 'data' in json_data:
-            # API returns dict with 'data' key
+        df = self._ohlc_response_to_df(
+            _first_symbol_data(json_data), interval_key, floating
+        )
+
+        if cache_path is not None:
+            _write_history_cache(df, cache_path)
+
+        return _apply_backend(df, backend)
+
+    @classmethod
+    @optimize_execution("VCI")
+    def history_many(
+        cls,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: Optional[str] = "1D",
+        show_log: Optional[bool] = False,
+        count_back: Optional[int] = None,
+        floating: Optional[int] = 2,
+        length: Optional[Union[str, int]] = None,
+        random_agent: bool = False,
+        proxy_config: Optional[ProxyConfig] = None,
+        proxy_mode: Optional[str] = None,
+        proxy_list: Optional[list] = None,
+        backend: Optional[str] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Tải lịch sử giá của nhiều mã chứng khoán trong một request duy nhất.
+
+        Tham số:
+            - symbols (bắt buộc): danh sách mã chứng khoán.
+            - start, end, interval, count_back, floating, length, show_log,
+              backend: giống như phương thức history.
+            - random_agent, proxy_config, proxy_mode, proxy_list (tùy chọn):
+              giống như khi khởi tạo Quote.
+
+        Trả về:
+            - dict {mã chứng khoán như khi truyền vào: DataFrame}. Mã không
+              có dữ liệu sẽ không xuất hiện trong kết quả.
+        """
+        if not symbols:
+            raise ValueError("Danh sách mã chứng khoán không được để trống.")
+        _check_backend(backend)
+
+        quotes = [
+            cls(
+                symbol,
+                random_agent=random_agent,
+                proxy_config=proxy_config,
+                proxy_mode=proxy_mode,
+                proxy_list=proxy_list
+            )
+            for symbol in symbols
+        ]
+        lead = quotes[0]
+
+        # The range is symbol independent: resolve it once for the batch
+        url, payload, interval_key, _ = lead._build_ohlc_request(
+            start, end, interval, count_back, length
+        )
+        payload["symbols"] = [quote.symbol for quote in quotes]
+
+        json_data = _cached_send_request(
+            url=url,
+            payload=payload,
+            ttl=get_config().cache.ttl,
+            headers=lead.headers,
+            method="POST",
+            show_log=show_log if show_log is not None else False,
+            proxy_list=lead.proxy_config.proxy_list,
+            proxy_mode=lead.proxy_config.proxy_mode,
+            request_mode=lead.proxy_config.request_mode,
+            session=lead._get_session(),
+            json_loader=_json_loads
+        )
+
+        if isinstance(json_data, dict) and 'data' in json_data:
             json_data = json_data['data']
+        if not isinstance(json_data, list):
+            json_data = []
+
+        # Match entries by their symbol field, falling back to request order
+        entries = {
+            entry['symbol']: entry
+            for entry in json_data
+            if isinstance(entry, dict) and entry.get('symbol')
+        }
+
+        # Results are keyed by the symbols as passed in, entries by the
+        # normalized (and index-mapped) symbol sent to VCI
+        results = {}
+        for position, (symbol, quote) in enumerate(zip(symbols, quotes)):
+            entry = entries.get(quote.symbol)
+            if entry is None and not entries and position < len(json_data):
+                entry = json_data[position]
+            if not entry:
+                logger.warning(f"Không tìm thấy dữ liệu cho mã {quote.symbol}.")
+                continue
+            try:
+                results[symbol] = _apply_backend(
+                    quote._ohlc_response_to_df(entry, interval_key, floating),
+                    backend
+                )
+            except ValueError as e:
+                logger.warning(f"{quote.symbol}: {e}")
+
+        return results
+
+    async def history_async(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: Optional[str] = "1D",
+        count_back: Optional[int] = None,
+        floating: Optional[int] = 2,
+        length: Optional[Union[str, int]] = None,
+        client=None,
+        backend: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Phiên bản async của history, dùng httpx.AsyncClient.
+
+        Tham số giống history, cộng thêm:
+            - client (tùy chọn): httpx.AsyncClient dùng chung. Nếu không
+              truyền vào, một client tạm sẽ được tạo cho lần gọi này.
 
-        # Transform VCI array format to row format
-        if isinstance(json_data, list) and len(json_data) > 0:
-            list_data = json_data
-            symbol_data = list_data[0]
-            if (
-                isinstance(symbol_data, dict) and
-                'o' in symbol_data and
-                isinstance(symbol_data['o'], list)
-            ):
-                # Vectorized conversion using pandas
-                json_data = pd.DataFrame({
-                    't': symbol_data['t'],
-                    'o': symbol_data['o'],
-                    'h': symbol_data['h'],
-                    'l': symbol_data['l'],
-                    'c': symbol_data['c'],
-                    'v': symbol_data['v']
-                }).to_dict('records')
-
-        if not json_data:
+        Lưu ý: phương thức async chỉ gửi request trực tiếp, không hỗ trợ
+        proxy. Mỗi request vẫn đi qua giới hạn truy cập (quota) VCI như
+        history().
+        """
+        _check_backend(backend)
+        if RequestMode(self.proxy_config.request_mode) == RequestMode.PROXY:
             raise ValueError(
-                "Không tìm thấy dữ liệu. Vui lòng kiểm tra lại "
-                "mã chứng khoán hoặc thời gian truy xuất."
+                "history_async chưa hỗ trợ proxy. "
+                "Vui lòng dùng history() khi cấu hình proxy."
             )
 
-        # Use the ohlc_to_df utility
-        df = ohlc_to_df(
-            data=json_data,
-            column_map=_OHLC_MAP,
-            dtype_map=_OHLC_DTYPE,
-            symbol=self.symbol,
-            asset_type=self.asset_type,
-            source=self.data_source,
-            interval=interval_key,
-            resample_map=_RESAMPLE_MAP
+        url, payload, interval_key, _ = self._build_ohlc_request(
+            start, end, interval, count_back, length
         )
 
-        return df
+        if client is None:
+            httpx = _import_httpx()
+            async with httpx.AsyncClient() as own_client:
+                return await self._fetch_history_async(
+                    own_client, url, payload, interval_key, floating, backend
+                )
+        return await self._fetch_history_async(
+            client, url, payload, interval_key, floating, backend
+        )
+
+    async def _fetch_history_async(
+        self,
+        client,
+        url: str,
+        payload: dict,
+        interval_key: str,
+        floating: Optional[int],
+        backend: Optional[str]
+    ) -> pd.DataFrame:
+        """
+        Send one prepared OHLC request through the quota guard and transform
+        the reply.
+        """
+        # The vnai guard may sleep while backing off: keep it off the loop
+        await asyncio.to_thread(_reserve_quota)
+        json_data = await _post_json_async(client, url, self.headers, payload)
+
+        df = self._ohlc_response_to_df(
+            _first_symbol_data(json_data), interval_key, floating
+        )
+        return _apply_backend(df, backend)
+
+    @classmethod
+    async def history_many_async(
+        cls,
+        symbols: List[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        interval: Optional[str] = "1D",
+        count_back: Optional[int] = None,
+        floating: Optional[int] = 2,
+        length: Optional[Union[str, int]] = None,
+        random_agent: bool = False,
+        max_connections: int = 20,
+        backend: Optional[str] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Tải lịch sử giá của nhiều mã chứng khoán song song (asyncio).
+
+        Mỗi mã được gửi trong một request riêng qua một httpx.AsyncClient
+        dùng chung, tối đa max_connections kết nối đồng thời. HTTP/2 được
+        bật khi thư viện h2 có sẵn. Mỗi request được tính vào giới hạn truy
+        cập (quota) VCI; khi vượt giới hạn, request sẽ chờ hoặc báo lỗi
+        giống history().
+
+        Trả về:
+            - dict {mã chứng khoán như khi truyền vào: DataFrame}. Mã lỗi
+              kết nối hoặc không có dữ liệu sẽ được ghi log và không xuất
+              hiện trong kết quả. Tham số không hợp lệ vẫn gây lỗi ValueError như history_many.
+        """
+        if not symbols:
+            raise ValueError("Danh sách mã chứng khoán không được để trống.")
+
+        _check_backend(backend)
+        httpx = _import_httpx()
+        quotes = [cls(symbol, random_agent=random_agent) for symbol in symbols]
+
+        # The range is symbol independent: resolve (and validate) it once
+        url, payload, interval_key, _ = quotes[0]._build_ohlc_request(
+            start, end, interval, count_back, length
+        )
+
+        async def fetch(quote):
+            try:
+                return await quote._fetch_history_async(
+                    client, url, dict(payload, symbols=[quote.symbol]),
+                    interval_key, floating, backend
+                )
+            except (ConnectionError, ValueError) as e:
+                logger.warning(f"{quote.symbol}: {e}")
+                return None
+
+        limits = httpx.Limits(max_connections=max_connections)
+        async with httpx.AsyncClient(
+            http2=find_spec('h2') is not None, limits=limits
+        ) as client:
+            frames = await asyncio.gather(*[fetch(quote) for quote in quotes])
+
+        return {
+            symbol: frame
+            for symbol, frame in zip(symbols, frames)
+            if frame is not None
+        }
 
     @optimize_execution("VCI")
     def intraday(
@@ -354,7 +874,8 @@ class Quote:
         page_size: Optional[int] = 100,
         last_time: Optional[Union[str, int, float]] = None,
         last_time_format: Optional[str] = None,
-        show_log: bool = False
+        show_log: bool = False,
+        backend: Optional[str] = None
     ) -> pd.DataFrame:
         """
         Truy xuất dữ liệu khớp lệnh của mã chứng khoán bất kỳ từ
@@ -371,12 +892,16 @@ class Quote:
               và 'YYYY-MM-DD'.
             - show_log (tùy chọn): Hiển thị thông tin log giúp debug
               dễ dàng. Mặc định là False.
+            - backend (tùy chọn): 'arrow' để trả về các cột văn bản dạng
+              chuỗi pyarrow (tiết kiệm bộ nhớ). Mặc định None (NumPy).
         """
+        _check_backend(backend)
+
         # Validator: Intraday data is not supported for indices
         if self.asset_type == 'index':
             raise ValueError(f"Dữ liệu intraday không được hỗ trợ cho chỉ số {self.symbol}.")
 
-        market_status = trading_hours("HOSE")
+        market_status = _market_status_at("HOSE", int(time.monotonic()))
         if (
             market_status['is_trading_hour'] is False and
             market_status['data_status'] == 'preparing'
@@ -410,15 +935,18 @@ class Quote:
         }
 
         # Fetch data using the send_request utility
-        data = send_request(
+        data = _cached_send_request(
             url=url,
+            payload=payload,
+            ttl=_INTRADAY_CACHE_TTL,
             headers=self.headers,
             method="POST",
-            payload=payload,
             show_log=show_log,
             proxy_list=self.proxy_config.proxy_list,
             proxy_mode=self.proxy_config.proxy_mode,
-            request_mode=self.proxy_config.request_mode
+            request_mode=self.proxy_config.request_mode,
+            session=self._get_session(),
+            json_loader=_json_loads
         )
 
         # Ensure data is a list
@@ -435,7 +963,7 @@ class Quote:
             source=self.data_source
         )
 
-        return df
+        return _apply_backend(df, backend)
 
 # Register VCI Quote provider
 from vnstock.core.registry import ProviderRegistry  # noqa: E402, F401